@@ -1,13 +1,117 @@
 """Core agent: orchestrates LLM, skills, code execution, and memory."""
 
+import asyncio
+import os
 import re
 from pathlib import Path
+from typing import Optional
 
 from llm_client import LLMClient
 from skill_loader import SkillLoader
 from code_runner import CodeRunner
 from memory import Memory
 
+try:
+    import re2 as _re_engine   # optional: google-re2, linear-time matching
+except ImportError:
+    _re_engine = re
+
+
+# ---------------------------------------------------------------------------
+# Action syntax — one alternation, so a response is scanned exactly once.
+# The matched group name (m.lastgroup) selects the handler.  Compiled with
+# RE2 when it is installed, so scan time stays linear in the response size.
+# ---------------------------------------------------------------------------
+
+_ACTION_RE = _re_engine.compile(
+    r"(?P<run>```run\s*\n(?P<code>(?s:.*?))```)"
+    r"|(?P<mset>\[MEMORY SET\s+(?P<sk>\S+?)=(?P<sv>.+?)\])"
+    r"|(?P<mget>\[MEMORY GET\s+(?P<gk>\S+)\])"
+    r"|(?P<mdel>\[MEMORY DEL\s+(?P<dk>\S+)\])"
+    r"|(?P<mlist>\[MEMORY LIST\])"
+    r"|(?P<skill>\[SKILL LOAD\s+(?P<sn>\S+)\])"
+)
+
+
+class _RunBlockScanner:
+    """Spots complete run blocks in a reply while it is still streaming in.
+
+    No other action can overlap a run-block opener, so a block is found from
+    its fences alone: ``` + "run" + whitespace containing a newline, then the
+    next ```.  Each fragment is looked at once (plus a few carried-over
+    characters), keeping the scan linear in the reply length.  The reply is
+    joined only when a block closes, to extract it with _ACTION_RE.
+    """
+
+    _OPENER = "```run"
+
+    def __init__(self):
+        self._chunks: list = []   # the reply so far
+        self._size = 0
+        self._pending = ""        # text not yet ruled out as holding an opener
+        self._pending_at = 0      # ... and its offset in the reply
+        self._open_at = -1        # offset of the opener of an unclosed block
+        self._carry = ""          # tail of an open block (a fence may straddle fragments)
+
+    @property
+    def text(self) -> str:
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def feed(self, piece: str) -> list:
+        """Append a fragment; return _ACTION_RE matches for blocks it closed."""
+        self._chunks.append(piece)
+        start = self._size
+        self._size += len(piece)
+        found: list = []
+
+        if self._open_at >= 0:
+            window = self._carry + piece
+            j = window.find("```")
+            if j < 0:
+                self._carry = window[-2:]
+                return found
+            self._close(start - len(self._carry) + j, found)
+        else:
+            self._pending += piece
+
+        while True:
+            text = self._pending
+            i = text.find(self._OPENER)
+            if i < 0:
+                keep = text[-(len(self._OPENER) - 1):]   # may be a partial opener
+                self._pending_at += len(text) - len(keep)
+                self._pending = keep
+                return found
+            rest = text[i + len(self._OPENER):]
+            body = rest.lstrip()
+            if "\n" not in rest[:len(rest) - len(body)]:
+                if body:   # not an opener after all
+                    self._pending_at += i + 1
+                    self._pending = text[i + 1:]
+                    continue
+                self._pending_at += i   # only whitespace so far; wait
+                self._pending = text[i:]
+                return found
+            self._open_at = self._pending_at + i
+            self._pending = ""
+            j = rest.find("```")
+            if j < 0:
+                self._carry = rest[-2:]
+                return found
+            self._close(self._open_at + len(self._OPENER) + j, found)
+
+    def _close(self, fence_at: int, found: list):
+        text = self.text
+        m = _ACTION_RE.match(text, self._open_at)
+        if m and m.lastgroup == "run":
+            found.append(m)
+        self._open_at = -1
+        self._carry = ""
+        self._pending_at = fence_at + 3
+        self._pending = text[fence_at + 3:]
+
 
 # ---------------------------------------------------------------------------
 # System prompt template — injected once per turn; skill/memory sections are
@@ -28,6 +132,10 @@ by embedding special syntax anywhere in your reply:
    The code executes in your workspace directory.  You can create, read, and
    modify files there.  Output (stdout/stderr) is captured and fed back to you.
 
+   Several run blocks in one reply execute at the same time, in no
+   guaranteed order.  If one step depends on another (e.g. write a file,
+   then read it), put both in the same block.
+
 2  MANAGE MEMORY
    Persist information across sessions:
 
@@ -56,6 +164,7 @@ class Agent:
     """Single entry-point for a conversational turn."""
 
     MAX_ACTION_ROUNDS = 5   # cap the execute→feedback loop
+    MAX_PARALLEL_RUNS = os.cpu_count() or 1   # concurrent run-block subprocesses
 
     def __init__(
         self,
@@ -64,16 +173,35 @@ class Agent:
         skill_paths: list,
         max_short_term: int = 20,
         summary_threshold: int = 15,
+        warm_workers: int = 0,
+        stream: bool = False,
+        skills: Optional[SkillLoader] = None,
     ):
         self.llm = llm
+        self.stream = stream   # start run blocks while the reply is still arriving
         self.workspace = workspace
-        self.skills = SkillLoader(skill_paths)
-        self.runner = CodeRunner(workspace)
+        # a caller may pass a loader it has already started scanning
+        self.skills = skills if skills is not None else SkillLoader(skill_paths)
+        self.runner = CodeRunner(workspace, warm_workers=warm_workers)
         self.memory = Memory(workspace, max_short_term, summary_threshold)
+        self._sys_prompt_cache: tuple = (-1, -1, "")   # (skills ver, keys ver, text)
+        self._handlers = {   # _ACTION_RE group name -> handler
+            "mset": self._memory_set,
+            "mget": self._memory_get,
+            "mdel": self._memory_del,
+            "mlist": self._memory_list,
+            "skill": self._skill_load,
+        }
 
     # ── system prompt ─────────────────────────────────────────
 
     def _system_prompt(self) -> str:
+        """Render the system prompt, reusing the last one while neither the
+        skill set nor the memory key set has changed."""
+        skill_ver, keys_ver, text = self._sys_prompt_cache
+        if skill_ver == self.skills.version and keys_ver == self.memory.keys_version:
+            return text
+
         parts = [_SYSTEM_PROMPT]
 
         skill_ctx = self.skills.descriptions()
@@ -88,99 +216,162 @@ class Agent:
                 f"Use [MEMORY GET key] to read any of them.\n"
             )
 
-        return "\n\n".join(parts)
+        text = "\n\n".join(parts)
+        # read versions after rendering: descriptions() may trigger discover()
+        self._sys_prompt_cache = (self.skills.version, self.memory.keys_version, text)
+        return text
 
-    # ── action parsing ────────────────────────────────────────
+    # ── action handlers ───────────────────────────────────────
+    #
+    # One per non-run alternative of _ACTION_RE; each returns its feedback line.
 
-    @staticmethod
-    def _extract_run_blocks(text: str) -> list:
-        """Pull every  ```run ... ```  block out of text."""
-        return re.findall(r"```run\s*\n(.*?)```", text, re.DOTALL)
+    def _memory_set(self, m) -> str:
+        self.memory.set(m.group("sk"), m.group("sv"))
+        return f"[saved {m.group('sk')}]"
+
+    def _memory_get(self, m) -> str:
+        val = self.memory.get(m.group("gk"))
+        return f"[{m.group('gk')} = {val if val is not None else '(not set)'}]"
+
+    def _memory_del(self, m) -> str:
+        if self.memory.delete(m.group("dk")):
+            return f"[deleted {m.group('dk')}]"
+        return f"[{m.group('dk')} not found]"
+
+    def _memory_list(self, m) -> str:
+        return f"[memory keys: {self.memory.keys()}]"
+
+    def _skill_load(self, m) -> str:
+        skill = self.skills.get(m.group("sn"))
+        if skill:
+            return f"--- Skill: {skill.name} ---\n{skill.content}\n--- end ---"
+        return (
+            f"[skill '{m.group('sn')}' not found. "
+            f"Available: {self.skills.list_names()}]"
+        )
 
     # ── action execution ──────────────────────────────────────
 
-    def _process(self, response: str) -> str:
-        """Execute all actions embedded in an LLM response.
+    async def _aprocess(
+        self,
+        response: str,
+        sem: Optional[asyncio.Semaphore] = None,
+        started: Optional[dict] = None,
+    ) -> str:
+        """Execute all actions embedded in an LLM response, in textual order.
+
+        Memory and skill actions run inline during a single scan; run blocks
+        are dispatched concurrently (bounded by *sem*, default
+        MAX_PARALLEL_RUNS) and their output is slotted back into place.
+        *started* maps match offsets to run-block tasks already launched
+        while the response was streaming; those are reused, not re-run.
 
         Returns a combined feedback string.  Empty string means nothing was
         executed — the caller should stop the action loop.
         """
+        sem = sem or asyncio.Semaphore(self.MAX_PARALLEL_RUNS)
+        started = started or {}
         out: list = []
-
-        # --- MEMORY SET ---
-        for m in re.finditer(r"\[MEMORY SET\s+(\S+?)=(.+?)\]", response):
-            self.memory.set(m.group(1), m.group(2))
-            out.append(f"[saved {m.group(1)}]")
-
-        # --- MEMORY GET ---
-        for m in re.finditer(r"\[MEMORY GET\s+(\S+)\]", response):
-            val = self.memory.get(m.group(1))
-            out.append(f"[{m.group(1)} = {val if val is not None else '(not set)'}]")
-
-        # --- MEMORY DEL ---
-        for m in re.finditer(r"\[MEMORY DEL\s+(\S+)\]", response):
-            if self.memory.delete(m.group(1)):
-                out.append(f"[deleted {m.group(1)}]")
+        runs: list = []   # (slot in out, task)
+
+        for m in _ACTION_RE.finditer(response):
+            if m.lastgroup == "run":
+                task = started.pop(m.start(), None)
+                if task is None:
+                    task = asyncio.ensure_future(self._run_block(m.group("code"), sem))
+                runs.append((len(out), task))
+                out.append("")
             else:
-                out.append(f"[{m.group(1)} not found]")
-
-        # --- MEMORY LIST ---
-        if "[MEMORY LIST]" in response:
-            out.append(f"[memory keys: {self.memory.keys()}]")
+                out.append(self._handlers[m.lastgroup](m))
 
-        # --- SKILL LOAD ---
-        for m in re.finditer(r"\[SKILL LOAD\s+(\S+)\]", response):
-            skill = self.skills.get(m.group(1))
-            if skill:
-                out.append(f"--- Skill: {skill.name} ---\n{skill.content}\n--- end ---")
-            else:
-                out.append(
-                    f"[skill '{m.group(1)}' not found. "
-                    f"Available: {self.skills.list_names()}]"
-                )
+        stale = list(started.values())   # no longer match the final text
+        for task in stale:
+            task.cancel()
+        if stale:
+            await asyncio.gather(*stale, return_exceptions=True)
 
-        # --- RUN blocks ---
-        for code in self._extract_run_blocks(response):
-            result = self.runner.run(code.strip())
-            lines: list = []
-            if result.stdout.strip():
-                lines.append(result.stdout.strip())
-            if result.stderr.strip():
-                lines.append(f"STDERR: {result.stderr.strip()}")
-            if result.returncode != 0:
-                lines.append(f"[exit code {result.returncode}]")
-            out.append("[code output]\n" + ("\n".join(lines) if lines else "(no output)"))
+        if runs:
+            results = await asyncio.gather(*(task for _, task in runs))
+            for (slot, _), text in zip(runs, results):
+                out[slot] = text
 
         return "\n\n".join(out)
 
+    async def _astream_reply(self, messages: list, sem: asyncio.Semaphore) -> tuple:
+        """Stream one reply, launching each run block as soon as its closing
+        fence arrives.  Returns (full text, {match offset: run task}).
+
+        If the stream fails, blocks already launched are cancelled (killing
+        their processes) before the error propagates.
+        """
+        scanner = _RunBlockScanner()
+        started: dict = {}
+        try:
+            async for piece in self.llm.astream_chat(messages):
+                for m in scanner.feed(piece):
+                    started[m.start()] = asyncio.ensure_future(
+                        self._run_block(m.group("code"), sem)
+                    )
+        except BaseException:
+            for task in started.values():
+                task.cancel()
+            await asyncio.gather(*started.values(), return_exceptions=True)
+            raise
+        return scanner.text, started
+
+    async def _run_block(self, code: str, sem: asyncio.Semaphore) -> str:
+        async with sem:
+            result = await self.runner.arun(code.strip())
+        lines: list = []
+        if result.stdout.strip():
+            lines.append(result.stdout.strip())
+        if result.stderr.strip():
+            lines.append(f"STDERR: {result.stderr.strip()}")
+        if result.returncode != 0:
+            lines.append(f"[exit code {result.returncode}]")
+        return "[code output]\n" + ("\n".join(lines) if lines else "(no output)")
+
     # ── public API ────────────────────────────────────────────
 
-    def chat(self, user_input: str) -> str:
-        """Process one user turn end-to-end.  Returns the final reply text."""
+    async def arun(self, user_input: str) -> str:
+        """Process one user turn end-to-end.  Returns the final reply text.
 
-        # compress history if the window is getting long
-        if self.memory.needs_summarization():
-            summary = self.llm.chat(
-                [{"role": "user", "content": self.memory.summarization_prompt()}],
-                temperature=0.0,
-            )
-            self.memory.apply_summary(summary)
+        Every LLM call is awaited, so turns of independent agents can run
+        concurrently on one event loop.
+        """
 
         self.memory.add_message("user", user_input)
 
         response = ""
         for _ in range(self.MAX_ACTION_ROUNDS):
-            messages = [
-                {"role": "system", "content": self._system_prompt()}
-            ] + self.memory.get_messages()
+            # compress history if the window is getting long; checked every
+            # round so a long action loop can't outgrow the window
+            if self.memory.needs_summarization():
+                summary = await self.llm.achat(
+                    [{"role": "user", "content": self.memory.summarization_prompt()}],
+                    temperature=0.0,
+                )
+                self.memory.apply_summary(summary)
+
+            messages = [{"role": "system", "content": self._system_prompt()}]
+            messages.extend(self.memory.get_messages())
 
-            response = self.llm.chat(messages)
+            sem = asyncio.Semaphore(self.MAX_PARALLEL_RUNS)
+            started: dict = {}
+            if self.stream:
+                response, started = await self._astream_reply(messages, sem)
+            else:
+                response = await self.llm.achat(messages)
             self.memory.add_message("assistant", response)
 
-            feedback = self._process(response)
+            feedback = await self._aprocess(response, sem, started)
             if not feedback:
                 break                          # nothing to execute — done
 
             self.memory.add_message("user", feedback)
 
         return response
+
+    def chat(self, user_input: str) -> str:
+        """Blocking wrapper around arun() for callers without an event loop."""
+        return asyncio.run(self.arun(user_input))
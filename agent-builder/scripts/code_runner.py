@@ -1,12 +1,39 @@
 """Executes Python code snippets inside an isolated workspace directory."""
 
+import asyncio
+import contextlib
+import io
 import subprocess
 import sys
 import os
+import signal
+import threading
+import traceback
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
 from pathlib import Path
 from typing import Optional
 
 
+# Each run gets its own process group so a timeout can take down anything the
+# snippet spawned, not just the interpreter itself.
+if os.name == "nt":
+    _NEW_GROUP = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _NEW_GROUP = {"start_new_session": True}
+
+
+def _kill_group(proc):
+    """Kill *proc* (a Popen or asyncio Process) and its whole process group."""
+    try:
+        if os.name == "nt":
+            proc.send_signal(signal.CTRL_BREAK_EVENT)
+            proc.kill()
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)   # session leader: pgid == pid
+    except (ProcessLookupError, OSError):
+        pass   # already gone
+
+
 class RunResult:
     """Outcome of a single code execution."""
 
@@ -22,31 +49,101 @@ class RunResult:
         return self.returncode == 0
 
 
+# ── warm worker pool (opt-in) ─────────────────────────────────
+#
+# Module-level so ProcessPoolExecutor can pickle them by reference.
+
+def _init_worker(workspace: str):
+    os.chdir(workspace)
+    os.environ["AGENT_WORKSPACE"] = workspace
+
+
+def _exec_in_worker(code: str, workspace: str) -> tuple:
+    """Run *code* in this worker, returning (stdout, stderr, returncode)."""
+    os.chdir(workspace)   # an earlier snippet may have moved it
+    out, err = io.StringIO(), io.StringIO()
+    returncode = 0
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            exec(compile(code, "<run>", "exec"), {"__name__": "__main__"})
+        except SystemExit as exc:
+            if exc.code is None or isinstance(exc.code, int):
+                returncode = exc.code or 0
+            else:
+                print(exc.code, file=sys.stderr)
+                returncode = 1
+        except BaseException:
+            traceback.print_exc()
+            returncode = 1
+    return out.getvalue(), err.getvalue(), returncode
+
+
 class CodeRunner:
     """Runs Python inside a sandboxed workspace directory.
 
     * CWD is always set to *workspace*.
     * The env var AGENT_WORKSPACE is exposed so scripts can locate the dir
       programmatically.
-    * Temp execution scripts are cleaned up automatically.
+    * Code strings are piped to ``python -`` on stdin; nothing is written to
+      the workspace on their behalf.
+    * With *warm_workers* > 0, run()/arun() execute code in a pool of
+      long-lived Python processes instead of a fresh interpreter per call.
+      Faster, but snippets share interpreter state (imports, globals of
+      loaded modules) with earlier runs in the same worker, and only
+      Python-level stdout/stderr is captured.  A timeout retires the pool:
+      new runs go to a fresh one, and the old one is killed as soon as the
+      runs still executing in it have finished.
     """
 
-    def __init__(self, workspace: Path, timeout: int = 30):
+    def __init__(self, workspace: Path, timeout: int = 30, warm_workers: int = 0):
         self.workspace = workspace
         self.workspace.mkdir(parents=True, exist_ok=True)
         self.timeout = timeout
+        self.warm_workers = warm_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._live: dict = {}   # pool -> futures whose callers still wait on them
+        self._pool_lock = threading.Lock()
+        if warm_workers > 0:
+            self._pool = self._new_pool()
 
     # ── core ──────────────────────────────────────────────────
 
     def run(self, code: str, timeout: Optional[int] = None) -> RunResult:
         """Execute an arbitrary code string.  Returns captured output."""
         timeout = timeout if timeout is not None else self.timeout
-        script = self.workspace / "_exec.py"
-        script.write_text(code, encoding="utf-8")
-        try:
-            return self._invoke(script, timeout)
-        finally:
-            script.unlink(missing_ok=True)
+        if self._pool is not None:
+            pool, fut = self._submit(code)
+            try:
+                return RunResult(*fut.result(timeout=timeout))
+            except FutureTimeout:
+                self._retire(pool)
+                return RunResult("", f"Timed out after {timeout}s.", -1)
+            except Exception as exc:   # e.g. a worker died mid-run
+                self._retire(pool)
+                return RunResult("", str(exc), -1)
+            finally:
+                self._finished(pool, fut)
+        return self._invoke("-", timeout, code)
+
+    async def arun(self, code: str, timeout: Optional[int] = None) -> RunResult:
+        """Awaitable run().  Several calls may execute side by side."""
+        timeout = timeout if timeout is not None else self.timeout
+        if self._pool is not None:
+            pool, fut = self._submit(code)
+            try:
+                return RunResult(*await asyncio.wait_for(asyncio.wrap_future(fut), timeout))
+            except asyncio.TimeoutError:
+                self._retire(pool)
+                return RunResult("", f"Timed out after {timeout}s.", -1)
+            except asyncio.CancelledError:
+                self._retire(pool)   # the snippet may still be running
+                raise
+            except Exception as exc:
+                self._retire(pool)
+                return RunResult("", str(exc), -1)
+            finally:
+                self._finished(pool, fut)
+        return await self._ainvoke("-", timeout, code)
 
     def run_file(self, filename: str, timeout: Optional[int] = None) -> RunResult:
         """Execute a file that already exists inside the workspace.
@@ -67,22 +164,114 @@ class CodeRunner:
             return RunResult("", f"File not found in workspace: {filename}", -1)
 
         timeout = timeout if timeout is not None else self.timeout
-        return self._invoke(target, timeout)
+        return self._invoke(str(target), timeout)
+
+    def close(self):
+        """Shut down the warm worker pool, if any."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    # ── warm pool management ──────────────────────────────────
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.warm_workers,
+            initializer=_init_worker,
+            initargs=(str(self.workspace),),
+        )
+
+    def _submit(self, code: str) -> tuple:
+        """Queue *code* on the current pool.  Returns (pool, future)."""
+        with self._pool_lock:
+            pool = self._pool
+            fut = pool.submit(_exec_in_worker, code, str(self.workspace))
+            self._live.setdefault(pool, set()).add(fut)
+        return pool, fut
+
+    def _retire(self, pool: ProcessPoolExecutor):
+        """Route new runs to a fresh pool.  *pool* may hold a runaway snippet;
+        it is killed once nothing else is waiting on it (see _finished)."""
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = self._new_pool()
+
+    def _finished(self, pool: ProcessPoolExecutor, fut):
+        """Forget *fut*; kill *pool* if it is retired and now unused."""
+        with self._pool_lock:
+            live = self._live.get(pool, set())
+            live.discard(fut)
+            if live or pool is self._pool:
+                return
+            self._live.pop(pool, None)
+        self._kill_pool(pool)
+
+    @staticmethod
+    def _kill_pool(pool: ProcessPoolExecutor):
+        # terminate rather than wait: a timed-out snippet may still be running
+        for proc in list((getattr(pool, "_processes", None) or {}).values()):
+            proc.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
 
     # ── shared subprocess logic ───────────────────────────────
 
-    def _invoke(self, script: Path, timeout: int) -> RunResult:
+    def _env(self) -> dict:
+        # UTF-8 stdio so output decodes the same way on every platform
+        return {**os.environ, "AGENT_WORKSPACE": str(self.workspace), "PYTHONIOENCODING": "utf-8"}
+
+    @staticmethod
+    def _result(out: bytes, err: bytes, returncode: int) -> RunResult:
+        return RunResult(
+            out.decode("utf-8", errors="replace"),
+            err.decode("utf-8", errors="replace"),
+            returncode,
+        )
+
+    def _invoke(self, script: str, timeout: int, source: Optional[str] = None) -> RunResult:
+        """Run ``python <script>``; *source* is fed on stdin (script "-")."""
         try:
-            proc = subprocess.run(
-                [sys.executable, str(script)],
-                capture_output=True,
-                text=True,
-                timeout=timeout,
+            proc = subprocess.Popen(
+                [sys.executable, script],
+                stdin=subprocess.PIPE if source is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 cwd=str(self.workspace),
-                env={**os.environ, "AGENT_WORKSPACE": str(self.workspace)},
+                env=self._env(),
+                **_NEW_GROUP,
             )
-            return RunResult(proc.stdout, proc.stderr, proc.returncode)
+        except Exception as exc:
+            return RunResult("", str(exc), -1)
+        stdin = source.encode("utf-8") if source is not None else None
+        try:
+            out, err = proc.communicate(stdin, timeout=timeout)
         except subprocess.TimeoutExpired:
+            _kill_group(proc)
+            proc.communicate()
             return RunResult("", f"Timed out after {timeout}s.", -1)
+        return self._result(out, err, proc.returncode)
+
+    async def _ainvoke(self, script: str, timeout: int, source: Optional[str] = None) -> RunResult:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable, script,
+                stdin=asyncio.subprocess.PIPE if source is not None else asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(self.workspace),
+                env=self._env(),
+                **_NEW_GROUP,
+            )
         except Exception as exc:
             return RunResult("", str(exc), -1)
+        stdin = source.encode("utf-8") if source is not None else None
+        try:
+            out, err = await asyncio.wait_for(proc.communicate(stdin), timeout)
+        except asyncio.TimeoutError:
+            _kill_group(proc)
+            await proc.wait()
+            return RunResult("", f"Timed out after {timeout}s.", -1)
+        except asyncio.CancelledError:
+            _kill_group(proc)   # don't leave the snippet running unattended
+            await proc.wait()
+            raise
+        return self._result(out, err, proc.returncode)
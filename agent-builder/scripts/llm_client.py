@@ -1,18 +1,95 @@
 """OpenAI-compatible chat client — stdlib only, no pip."""
 
+import asyncio
+import hashlib
+import http.client
 import json
-import urllib.request
-import urllib.error
-from typing import Optional
+import threading
+from typing import AsyncIterator, Iterator, Optional
+from urllib.parse import urlsplit
+
+try:
+    import orjson   # optional speed-up.  Same JSON values as the stdlib path,
+                    # but non-ASCII is sent as raw UTF-8, not \u escapes.
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _in_daemon_thread(fn, *args) -> asyncio.Future:
+    """Run fn(*args) on a daemon thread; returns a future for its result.
+
+    asyncio.to_thread() uses the loop's default executor, which asyncio.run()
+    joins on the way out — so Ctrl-C would wait for the HTTP call to finish.
+    A daemon thread is simply abandoned instead.
+    """
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+
+    def settle(result, exc):
+        if fut.done():            # awaiting task was cancelled
+            return
+        if exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(result)
+
+    def work():
+        try:
+            result, exc = fn(*args), None
+        except BaseException as e:
+            result, exc = None, e
+        try:
+            loop.call_soon_threadsafe(settle, result, exc)
+        except RuntimeError:      # loop already closed
+            pass
+
+    threading.Thread(target=work, daemon=True).start()
+    return fut
 
 
 class LLMClient:
-    """HTTP client that talks to any OpenAI-compatible /v1 endpoint."""
+    """HTTP client that talks to any OpenAI-compatible /v1 endpoint.
+
+    Connections are HTTP/1.1 keep-alive and pooled per client, so repeated
+    calls skip the TCP (and TLS) handshake.  The pool is thread-safe, which
+    lets achat() calls overlap.
+    """
+
+    POOL_SIZE = 8      # idle connections kept for reuse
+    TIMEOUT = 120      # seconds, per socket operation
 
-    def __init__(self, base_url: str, api_key: str = "", model: str = "llama3"):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str = "",
+        model: str = "llama3",
+        cache_prompts: bool = False,
+    ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.model = model
+        # mark a leading system prompt as a cacheable prefix (opt-in: not every
+        # endpoint accepts list-form message content)
+        self.cache_prompts = cache_prompts
+        self._cache_key: tuple = (None, "")   # (last system prompt, its key)
+
+        parts = urlsplit(self.base_url)
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port
+        self._prefix = parts.path
+        self._idle: list = []          # pooled keep-alive connections
+        self._lock = threading.Lock()
 
     def chat(
         self,
@@ -21,8 +98,101 @@ class LLMClient:
         max_tokens: Optional[int] = None,
     ) -> str:
         """Send a chat-completion request.  Returns the assistant reply text."""
-        url = f"{self.base_url}/chat/completions"
+        payload = self._payload(messages, temperature, max_tokens)
+        conn, resp = self._post("/chat/completions", _dumps(payload))
+        try:
+            body = resp.read()
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            raise RuntimeError(f"Could not reach {self.base_url}: {exc}") from exc
+        self._release(conn, resp)
 
+        if resp.status >= 400:
+            raise RuntimeError(
+                f"LLM request failed ({resp.status}): {body.decode('utf-8', errors='replace')}"
+            )
+        result = _loads(body)
+        return result["choices"][0]["message"]["content"]
+
+    async def achat(
+        self,
+        messages: list,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """Awaitable chat().  The blocking request runs on a daemon thread so
+        independent sessions can overlap their network waits."""
+        return await _in_daemon_thread(self.chat, messages, temperature, max_tokens)
+
+    def stream_chat(
+        self,
+        messages: list,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Like chat(), but yields the reply in fragments as the endpoint
+        produces them (``"stream": true`` server-sent events)."""
+        payload = self._payload(messages, temperature, max_tokens)
+        payload["stream"] = True
+        conn, resp = self._post("/chat/completions", _dumps(payload))
+
+        finished = False
+        try:
+            if resp.status >= 400:
+                body = resp.read().decode("utf-8", errors="replace")
+                finished = True
+                raise RuntimeError(f"LLM request failed ({resp.status}): {body}")
+            for line in resp:                       # one SSE line at a time
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    break
+                choices = _loads(data).get("choices") or [{}]
+                piece = (choices[0].get("delta") or {}).get("content")
+                if piece:
+                    yield piece
+            resp.read()                             # drain so the socket can be reused
+            finished = True
+        except (OSError, http.client.HTTPException) as exc:
+            raise RuntimeError(f"Could not reach {self.base_url}: {exc}") from exc
+        finally:
+            if finished:
+                self._release(conn, resp)
+            else:
+                conn.close()   # abandoned mid-stream — socket state unknown
+
+    async def astream_chat(
+        self,
+        messages: list,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """Async-iterator form of stream_chat().  The socket is read on a
+        daemon thread; fragments are handed to the event loop as they land."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        end = object()
+
+        def pump():
+            try:
+                for piece in self.stream_chat(messages, temperature, max_tokens):
+                    loop.call_soon_threadsafe(queue.put_nowait, piece)
+                loop.call_soon_threadsafe(queue.put_nowait, end)
+            except Exception as exc:
+                loop.call_soon_threadsafe(queue.put_nowait, exc)
+
+        worker = _in_daemon_thread(pump)
+        while True:
+            item = await queue.get()
+            if item is end:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+        await worker
+
+    def _payload(self, messages: list, temperature: float, max_tokens: Optional[int]) -> dict:
         payload: dict = {
             "model": self.model,
             "messages": messages,
@@ -30,19 +200,75 @@ class LLMClient:
         }
         if max_tokens is not None:
             payload["max_tokens"] = max_tokens
+        if self.cache_prompts and messages and messages[0].get("role") == "system":
+            self._mark_cacheable(payload)
+        return payload
+
+    def _mark_cacheable(self, payload: dict):
+        """Tag the system prompt for provider-side prefix caching.
 
-        data = json.dumps(payload).encode("utf-8")
+        Anthropic-style endpoints read the ``cache_control`` marker; OpenAI
+        and vLLM route requests with the same ``prompt_cache_key`` to the
+        same cache.
+        """
+        messages = payload["messages"]
+        prompt = messages[0]["content"]
+        if not isinstance(prompt, str):
+            return
+        payload["messages"] = [
+            {
+                "role": "system",
+                "content": [
+                    {"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}
+                ],
+            },
+            *messages[1:],
+        ]
+        # the agent reuses one prompt string while it is unchanged, so an
+        # identity check usually skips re-hashing a multi-KB prompt
+        last, key = self._cache_key
+        if prompt is not last:
+            key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:32]
+            self._cache_key = (prompt, key)
+        payload["prompt_cache_key"] = key
+
+    # ── connection pool ───────────────────────────────────────
+
+    def _post(self, endpoint: str, data: bytes) -> tuple:
+        """POST to base_url + endpoint.  Returns (connection, response) with
+        the body still unread; hand both to _release() once it is consumed."""
         headers = {"Content-Type": "application/json"}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
 
-        req = urllib.request.Request(url, data=data, headers=headers, method="POST")
-        try:
-            with urllib.request.urlopen(req, timeout=120) as resp:
-                result = json.loads(resp.read().decode("utf-8"))
-                return result["choices"][0]["message"]["content"]
-        except urllib.error.HTTPError as exc:
-            body = exc.read().decode("utf-8")
-            raise RuntimeError(f"LLM request failed ({exc.code}): {body}") from exc
-        except urllib.error.URLError as exc:
-            raise RuntimeError(f"Could not reach {self.base_url}: {exc.reason}") from exc
+        while True:
+            conn, reused = self._acquire()
+            try:
+                conn.request("POST", self._prefix + endpoint, body=data, headers=headers)
+                return conn, conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+                conn.close()
+                if reused:
+                    continue   # server dropped an idle keep-alive socket — retry fresh
+                raise RuntimeError(f"Could not reach {self.base_url}: {exc}") from exc
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                raise RuntimeError(f"Could not reach {self.base_url}: {exc}") from exc
+
+    def _acquire(self) -> tuple:
+        """Return (connection, reused) — an idle pooled one if available."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        cls = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+        return cls(self._host, self._port, timeout=self.TIMEOUT), False
+
+    def _release(self, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse):
+        if resp.will_close:
+            conn.close()
+            return
+        with self._lock:
+            if len(self._idle) < self.POOL_SIZE:
+                self._idle.append(conn)
+                return
+        conn.close()
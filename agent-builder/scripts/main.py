@@ -14,6 +14,7 @@ import argparse
 import json
 import sys
 import os
+import threading
 from pathlib import Path
 
 # make sibling modules importable regardless of CWD
@@ -21,6 +22,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from llm_client import LLMClient   # noqa: E402
 from agent import Agent            # noqa: E402
+from skill_loader import SkillLoader  # noqa: E402
 
 
 # ---------------------------------------------------------------------------
@@ -28,10 +30,12 @@ from agent import Agent            # noqa: E402
 # ---------------------------------------------------------------------------
 
 _DEFAULTS = {
-    "llm":       {"base_url": "http://localhost:11434/v1", "api_key": "", "model": "llama3"},
+    "llm":       {"base_url": "http://localhost:11434/v1", "api_key": "", "model": "llama3",
+                  "stream": False, "cache_prompts": False},
     "workspace": "./workspace",
     "skills":    {"paths": ["./skills/"]},
     "memory":    {"max_short_term": 20, "summary_threshold": 15},
+    "runner":    {"warm_workers": 0},
 }
 
 
@@ -77,6 +81,11 @@ def main():
 
     cfg = _load_config(args.config)
 
+    # scan skills on a background thread while the rest of start-up runs
+    skill_loader = SkillLoader(cfg["skills"]["paths"])
+    scan = threading.Thread(target=skill_loader.discover, daemon=True)
+    scan.start()
+
     # CLI flags override config
     if args.url:       cfg["llm"]["base_url"] = args.url
     if args.model:     cfg["llm"]["model"]    = args.model
@@ -87,21 +96,29 @@ def main():
 
     workspace = Path(cfg["workspace"]).resolve()
 
-    llm   = LLMClient(base_url=cfg["llm"]["base_url"], api_key=api_key, model=cfg["llm"]["model"])
+    llm   = LLMClient(
+        base_url=cfg["llm"]["base_url"],
+        api_key=api_key,
+        model=cfg["llm"]["model"],
+        cache_prompts=cfg["llm"]["cache_prompts"],
+    )
     agent = Agent(
         llm=llm,
         workspace=workspace,
         skill_paths=cfg["skills"]["paths"],
         max_short_term=cfg["memory"]["max_short_term"],
         summary_threshold=cfg["memory"]["summary_threshold"],
+        warm_workers=cfg["runner"]["warm_workers"],
+        stream=cfg["llm"]["stream"],
+        skills=skill_loader,
     )
 
-    # discover skills and print startup banner
-    skills = agent.skills.discover()
+    # startup banner
     print("agent-builder ready")
     print(f"  model:     {cfg['llm']['model']}  ({cfg['llm']['base_url']})")
     print(f"  workspace: {workspace}")
-    print(f"  skills:    {', '.join(s.name for s in skills) or '(none)'}")
+    scan.join()
+    print(f"  skills:    {', '.join(agent.skills.list_names()) or '(none)'}")
     print(f"  memory:    {len(agent.memory.keys())} long-term key(s)")
     print(f"  type /help for local commands, or just start chatting.\n")
 
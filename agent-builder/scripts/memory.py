@@ -1,26 +1,55 @@
 """Two-tier memory: ephemeral conversation window + persistent key-value store.
 
 Short-term
-    A list of {role, content} message dicts that mirrors what gets sent to the
-    LLM.  When the list reaches *summary_threshold* messages the agent can ask
+    A deque of {role, content} message dicts that mirrors what gets sent to
+    the LLM.  When it reaches *summary_threshold* messages the agent can ask
     the LLM to summarise it; call apply_summary() with the result to compress
-    history down to a summary + a short tail of recent messages.
+    history down to a summary + a short tail of recent messages.  The deque
+    also has a hard cap, set above the point where the agent summarises, so
+    it only drops messages if summarisation is never run.
 
 Long-term
-    A JSON-backed dict (workspace/_memory.json) that is written to disk on
-    every mutation.  Survives process restarts.  Values are limited to
+    A JSON-backed dict (workspace/_memory.json).  Mutations mark the store
+    dirty and schedule a write ~50 ms later, so a burst of SETs costs one
+    rewrite; the file is replaced atomically and any pending write is flushed
+    at interpreter exit.  Survives process restarts.  Values are limited to
     JSON-serialisable scalars for simplicity; store structured data as files
     in the workspace instead.
 """
 
+import atexit
 import json
+import os
+import threading
+import weakref
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
+
+try:
+    import orjson   # optional speed-up; falls back to compact stdlib json.  Only
+                    # non-ASCII encoding differs (raw UTF-8 vs \u escapes);
+                    # either form loads back the same.
+except ImportError:
+    orjson = None
+
+
+# Every live store is flushed at exit.  Held weakly so registering for the
+# exit hook doesn't keep a discarded Memory alive.
+_live: weakref.WeakSet = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    for mem in list(_live):
+        mem.flush()
 
 
 class Memory:
 
     STORE_FILE = "_memory.json"
+    FLUSH_DELAY = 0.05   # seconds of quiet before a dirty store is written
 
     def __init__(self, workspace: Path, max_short_term: int = 20, summary_threshold: int = 15):
         self.workspace = workspace
@@ -30,17 +59,28 @@ class Memory:
         self.max_short_term = max_short_term
         self.summary_threshold = summary_threshold
 
-        self.short_term: list = []        # [{role, content}, ...]
+        # safety bound only: the agent checks needs_summarization() before
+        # every LLM call and adds at most two messages in between
+        cap = max(max_short_term, summary_threshold + 2)
+        self.short_term: deque = deque(maxlen=cap)   # [{role, content}, ...]
+        self._lines: deque = deque(maxlen=cap)       # "ROLE: content", parallel
         self.long_term: dict = {}         # key -> value
+        self._keys_version = 0            # bumped when the key set changes
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
         self._load()
+        _live.add(self)
 
     # ── short-term ────────────────────────────────────────────
 
     def add_message(self, role: str, content: str):
         self.short_term.append({"role": role, "content": content})
+        self._lines.append(f"{role.upper()}: {content}")
 
-    def get_messages(self) -> list:
-        return list(self.short_term)
+    def get_messages(self) -> deque:
+        """The live message window — read it, don't mutate it."""
+        return self.short_term
 
     def needs_summarization(self) -> bool:
         """True once the window has grown large enough to warrant compression."""
@@ -48,59 +88,99 @@ class Memory:
 
     def summarization_prompt(self) -> str:
         """Produce the prompt text to hand to the LLM for summarisation."""
-        transcript = "\n".join(
-            f"{m['role'].upper()}: {m['content']}" for m in self.short_term
-        )
         return (
             "Summarize the following conversation. Preserve every key decision, "
             "fact, file path, and pending action item. Be concise.\n\n"
-            + transcript
+            + "\n".join(self._lines)
         )
 
     def apply_summary(self, summary: str):
         """Compress history: one summary message + the most recent tail."""
         keep = max(0, self.max_short_term - self.summary_threshold)
-        tail = self.short_term[-keep:] if keep > 0 else []
-        self.short_term = [
-            {"role": "system", "content": f"[Previous conversation summary]\n{summary}"}
-        ] + tail
+        skip = max(0, len(self.short_term) - keep)
+        tail = list(islice(self.short_term, skip, None)) if keep > 0 else []
+        tail_lines = list(islice(self._lines, skip, None)) if keep > 0 else []
+        content = f"[Previous conversation summary]\n{summary}"
+
+        self.short_term.clear()
+        self.short_term.append({"role": "system", "content": content})
+        self.short_term.extend(tail)
+        self._lines.clear()
+        self._lines.append(f"SYSTEM: {content}")
+        self._lines.extend(tail_lines)
 
     def clear(self):
         """Discard all short-term messages."""
         self.short_term.clear()
+        self._lines.clear()
 
     # ── long-term ─────────────────────────────────────────────
 
     def set(self, key: str, value: Any):
-        self.long_term[key] = value
-        self._save()
+        with self._lock:
+            if key not in self.long_term:
+                self._keys_version += 1
+            self.long_term[key] = value
+        self._flush_soon()
 
     def get(self, key: str, default: Any = None) -> Any:
         return self.long_term.get(key, default)
 
     def delete(self, key: str) -> bool:
-        if key in self.long_term:
+        with self._lock:
+            if key not in self.long_term:
+                return False
             del self.long_term[key]
-            self._save()
-            return True
-        return False
+            self._keys_version += 1
+        self._flush_soon()
+        return True
 
     def keys(self) -> list:
         return list(self.long_term.keys())
 
+    @property
+    def keys_version(self) -> int:
+        """Changes whenever a key is added or removed."""
+        return self._keys_version
+
     # ── persistence ───────────────────────────────────────────
 
     def _load(self):
         if self._store_path.is_file():
             try:
-                self.long_term = json.loads(
-                    self._store_path.read_text(encoding="utf-8")
-                )
-            except (json.JSONDecodeError, OSError):
+                raw = self._store_path.read_bytes()
+                self.long_term = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except (ValueError, OSError):   # JSONDecodeError is a ValueError
                 self.long_term = {}
 
+    def flush(self):
+        """Write pending long-term changes to disk now."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        self._save()
+
+    def _flush_soon(self):
+        """Mark the store dirty and (re)start the debounce timer."""
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(self.FLUSH_DELAY, self._save)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
     def _save(self):
-        self._store_path.write_text(
-            json.dumps(self.long_term, indent=2, default=str),
-            encoding="utf-8",
-        )
+        with self._lock:
+            if not self._dirty:
+                return
+            # write-then-rename so a crash never leaves a half-written store
+            tmp = self._store_path.with_suffix(".json.tmp")
+            if orjson is not None:
+                data = orjson.dumps(self.long_term, default=str)
+            else:
+                data = json.dumps(self.long_term, separators=(",", ":"), default=str).encode("utf-8")
+            tmp.write_bytes(data)
+            os.replace(tmp, self._store_path)
+            self._dirty = False
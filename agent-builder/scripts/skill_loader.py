@@ -1,40 +1,98 @@
 """Discovers and loads skills from local filesystem paths."""
 
+import os
 import re
+import stat
 from pathlib import Path
 from typing import Optional
 
 
+_FM_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n?(.*)", re.DOTALL)
+# top-level "key: value" lines only — comments, list items and indented
+# (nested) lines cannot match the column-0 key
+_FM_LINE_RE = re.compile(r"^([A-Za-z_][\w-]*)[ \t]*:(.*)$", re.MULTILINE)
+
+
 class Skill:
-    """One loaded skill: parsed frontmatter + full body."""
+    """One discovered skill: parsed frontmatter; the body is read on first use."""
 
-    __slots__ = ("name", "description", "content", "path")
+    __slots__ = ("name", "description", "path", "_content")
 
-    def __init__(self, name: str, description: str, content: str, path: Path):
+    def __init__(self, name: str, description: str, content: Optional[str], path: Path):
         self.name = name
         self.description = description
-        self.content = content   # markdown body (everything after frontmatter)
         self.path = path
+        self._content = content   # None until first access
+
+    @property
+    def content(self) -> str:
+        """Markdown body (everything after frontmatter), read from disk lazily."""
+        if self._content is None:
+            try:
+                text = (self.path / "SKILL.md").read_text(encoding="utf-8")
+            except OSError:
+                return ""
+            self._content = parse_skill_md(text)["body"]
+        return self._content
 
 
 def parse_skill_md(text: str) -> dict:
     """Split a SKILL.md into a flat frontmatter dict and the body string."""
-    match = re.match(r"^---\s*\n(.*?)\n---\s*\n?(.*)", text, re.DOTALL)
+    match = _FM_RE.match(text)
     if not match:
         return {"frontmatter": {}, "body": text.strip()}
 
-    frontmatter: dict = {}
-    for line in match.group(1).splitlines():
-        stripped = line.strip()
-        # only top-level key: value lines (skip comments, list items, nested blocks)
-        if ":" in stripped and not stripped.startswith(("#", "-", " ")):
-            key, _, val = stripped.partition(":")
-            key = key.strip()
-            val = val.strip().strip("'\"")
-            if key and val:
-                frontmatter[key] = val
+    return {
+        "frontmatter": _parse_frontmatter(match.group(1)),
+        "body": _strip_span(text, *match.span(2)),
+    }
+
+
+def read_frontmatter(skill_md) -> dict:
+    """Parse just the frontmatter of a SKILL.md file.
+
+    Reading stops at the closing ``---``, so the body is never loaded.
+    """
+    with open(skill_md, encoding="utf-8") as fh:
+        if fh.readline().rstrip() != "---":
+            return {}
+        block: list = []
+        for line in fh:
+            if line.rstrip() == "---":
+                return _parse_frontmatter("".join(block))
+            block.append(line)
+    return {}   # unterminated — parse_skill_md() treats it all as body too
+
+
+def _parse_frontmatter(block: str) -> dict:
+    return {
+        m.group(1): val
+        for m in _FM_LINE_RE.finditer(block)
+        if (val := m.group(2).strip().strip("'\""))
+    }
+
 
-    return {"frontmatter": frontmatter, "body": match.group(2).strip()}
+def _strip_span(text: str, start: int, end: int) -> str:
+    """text[start:end].strip() with a single copy — the bounds are trimmed
+    first, so the untrimmed body is never materialised."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return text[start:end]
+
+
+def _subdirs(path) -> list:
+    """Directory entries directly under *path*; [] if it cannot be listed.
+
+    os.scandir answers is_dir() from the directory listing itself on most
+    platforms, so no extra stat() is spent per entry.
+    """
+    try:
+        with os.scandir(path) as it:
+            return [e for e in it if e.is_dir()]
+    except OSError:
+        return []
 
 
 class SkillLoader:
@@ -43,43 +101,69 @@ class SkillLoader:
     def __init__(self, paths: list):
         self.paths = [Path(p).expanduser().resolve() for p in paths]
         self._cache: dict = {}   # name -> Skill
+        self._parsed: dict = {}  # SKILL.md path -> (mtime_ns, size, Skill)
+        self._version = 0        # bumped whenever names/descriptions change
 
     # ── discovery ─────────────────────────────────────────────
 
     def discover(self) -> list:
-        """(Re-)scan all paths and return every skill found."""
-        self._cache.clear()
+        """(Re-)scan all paths and return every skill found.
+
+        A SKILL.md whose mtime and size are unchanged since the last scan is
+        not re-read; entries whose file has disappeared are dropped.
+        """
+        before = {n: s.description for n, s in self._cache.items()}
+        found: dict = {}
+        seen: set = set()
         for base in self.paths:
-            if not base.is_dir():
-                continue
-            for entry in base.iterdir():
-                self._try_load(entry)
+            for entry in _subdirs(base):
+                self._try_load(entry.path, found, seen)
                 # one level deeper for monorepo layouts
-                if entry.is_dir():
-                    for nested in entry.iterdir():
-                        self._try_load(nested)
+                for nested in _subdirs(entry.path):
+                    self._try_load(nested.path, found, seen)
+
+        for stale in self._parsed.keys() - seen:
+            del self._parsed[stale]
+        self._cache = found
+        if before != {n: s.description for n, s in found.items()}:
+            self._version += 1
         return list(self._cache.values())
 
-    def _try_load(self, path: Path):
-        skill_md = path / "SKILL.md"
-        if not skill_md.is_file():
-            return
+    def _try_load(self, path: str, found: dict, seen: set):
+        skill_md = os.path.join(path, "SKILL.md")
         try:
-            text = skill_md.read_text(encoding="utf-8")
-            parsed = parse_skill_md(text)
-            name = parsed["frontmatter"].get("name", path.name)
-            if name not in self._cache:
-                self._cache[name] = Skill(
-                    name=name,
-                    description=parsed["frontmatter"].get("description", ""),
-                    content=parsed["body"],
-                    path=path,
-                )
+            st = os.stat(skill_md)
         except OSError:
-            pass   # unreadable — skip silently
+            return
+        if not stat.S_ISREG(st.st_mode):
+            return
+        seen.add(skill_md)
+
+        hit = self._parsed.get(skill_md)
+        if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            skill = hit[2]
+        else:
+            try:
+                frontmatter = read_frontmatter(skill_md)
+            except (OSError, UnicodeDecodeError):
+                return   # unreadable — skip silently
+            skill = Skill(
+                name=frontmatter.get("name", os.path.basename(path)),
+                description=frontmatter.get("description", ""),
+                content=None,   # loaded on first [SKILL LOAD]
+                path=Path(path),
+            )
+            self._parsed[skill_md] = (st.st_mtime_ns, st.st_size, skill)
+
+        found.setdefault(skill.name, skill)   # first path wins on name clashes
 
     # ── accessors ─────────────────────────────────────────────
 
+    @property
+    def version(self) -> int:
+        """Changes whenever a (re-)scan alters skill names or descriptions."""
+        return self._version
+
     def get(self, name: str) -> Optional[Skill]:
         """Retrieve one skill by name.  Triggers discovery if cache is empty."""
         if not self._cache:
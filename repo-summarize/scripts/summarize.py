@@ -6,18 +6,47 @@ Usage:
     python summarize.py <repo>
     python summarize.py facebook/react
     python summarize.py https://github.com/facebook/react
+    python summarize.py --repos-file repos.txt
 """
 
 import argparse
+import asyncio
+import functools
+import gzip
+import hashlib
+import heapq
+import http.client
+import io
 import json
 import os
 import re
 import sys
-import urllib.request
+import threading
+import time
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from urllib.parse import urljoin, urlsplit
 from pathlib import Path
 from typing import Optional
 
+# Optional, used for parsing only: output always comes from json.dumps, so it
+# looks the same (ASCII-escaped) either way.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+# Markdown headers, badges/images and HTML tags -- never part of the purpose
+_SKIP_LINE_RE = re.compile(r"^\s*(?:#|\[!\[|!\[|<)")
+
+IMPORTANT_FILES = frozenset({"README.md", "package.json", "setup.py", "pyproject.toml",
+                             "Cargo.toml", "go.mod", "Makefile", "CONTRIBUTING.md"})
+
+@functools.lru_cache(maxsize=1)
 def load_env_file() -> dict:
     """Load variables from .env file."""
     # Look for .env in project root (two levels up from scripts/)
@@ -38,6 +67,7 @@ def load_env_file() -> dict:
             result[key.strip()] = value.strip().strip('"').strip("'")
     return result
 
+@functools.lru_cache(maxsize=1)
 def get_github_token() -> Optional[str]:
     """Get GitHub token from .env or environment."""
     env_vars = load_env_file()
@@ -46,55 +76,296 @@ def get_github_token() -> Optional[str]:
         token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
     return token
 
-def github_request(endpoint: str) -> Optional[dict]:
-    """Make a GitHub API request."""
-    url = f"https://api.github.com{endpoint}" if endpoint.startswith("/") else endpoint
-    headers = {
-        "User-Agent": "repo-summarize",
-        "Accept": "application/vnd.github.v3+json"
-    }
+@functools.lru_cache(maxsize=1)
+def _base_headers() -> dict:
+    """Headers sent with every request (copy before adding to them)."""
+    headers = {"User-Agent": "repo-summarize", "Accept-Encoding": "gzip"}
     token = get_github_token()
     if token:
         headers["Authorization"] = f"token {token}"
+    return headers
+
+# Keep-alive connections, pooled per host, so repeat requests -- and the
+# worker threads of a --repos-file batch -- skip the TCP+TLS handshake.
+_POOL_SIZE = 10            # idle connections kept per host
+_MAX_REDIRECTS = 5
+_idle: dict = {}           # host -> [HTTPSConnection, ...]
+_pool_lock = threading.Lock()
+
+def _acquire(host: str, timeout: float) -> tuple:
+    """Return (connection, reused) -- an idle pooled one if available."""
+    with _pool_lock:
+        conns = _idle.get(host)
+        if conns:
+            return conns.pop(), True
+    return http.client.HTTPSConnection(host, timeout=timeout), False
+
+def _release(host: str, conn: http.client.HTTPSConnection, resp: http.client.HTTPResponse):
+    # only a fully read response leaves the socket reusable
+    if resp.will_close or not resp.isclosed():
+        conn.close()
+        return
+    with _pool_lock:
+        conns = _idle.setdefault(host, [])
+        if len(conns) < _POOL_SIZE:
+            conns.append(conn)
+            return
+    conn.close()
+
+def _request(url: str, headers: dict, timeout: float,
+             data: Optional[bytes] = None, max_bytes: Optional[int] = None) -> tuple:
+    """GET url (POST when data is given) over a pooled connection, following
+    redirects.  Returns (status, headers, body); a gzip body is decompressed
+    and at most max_bytes are read when given."""
+    for _ in range(_MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        host = parts.netloc
+        target = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        while True:
+            conn, reused = _acquire(host, timeout)
+            try:
+                conn.request("POST" if data is not None else "GET", target,
+                             body=data, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read(max_bytes) if max_bytes else resp.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not reused:
+                    raise
+                # server dropped an idle keep-alive socket -- retry fresh
+            except BaseException:
+                conn.close()
+                raise
+        _release(host, conn, resp)
+
+        location = resp.headers.get("Location")
+        if resp.status in (301, 302, 303, 307, 308) and location:
+            url = urljoin(url, location)
+            continue
+        if resp.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return resp.status, resp.headers, body
+    raise http.client.HTTPException(f"Too many redirects: {url}")
+
+# Conditional-request cache: ETag/Last-Modified + body per URL.  A 304 reply
+# costs no body bytes and does not count against GitHub's primary rate limit.
+# Entries younger than CACHE_TTL seconds are used without any request at all.
+CACHE_DIR = Path.home() / ".cache" / "repo-summarize"
+CACHE_TTL = 0.0      # --cache-ttl
+USE_CACHE = True     # --no-cache turns the cache off entirely
+
+def _cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+def _cache_get(url: str) -> Optional[dict]:
+    """Return the cached {etag, last_modified, body, fetched_at} entry for url, if any."""
+    if not USE_CACHE:
+        return None
+    try:
+        return _loads(_cache_path(url).read_bytes())
+    except (OSError, ValueError):
+        return None
 
+def _cache_put(url: str, etag: Optional[str], last_modified: Optional[str], body: str):
+    """Store a response body with its validators (best effort)."""
+    if not USE_CACHE or not (etag or last_modified or CACHE_TTL):
+        return
+    entry = {"etag": etag, "last_modified": last_modified, "body": body,
+             "fetched_at": time.time()}
     try:
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return None
-        raise
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _cache_path(url)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+def _cache_fresh(cached: Optional[dict]) -> bool:
+    """True if the entry is recent enough to use without revalidating."""
+    return bool(cached) and time.time() - cached.get("fetched_at", 0) < CACHE_TTL
+
+def _cache_revalidated(url: str, cached: dict):
+    """Restart the TTL of an entry the server just confirmed with a 304."""
+    if CACHE_TTL:
+        _cache_put(url, cached["etag"], cached["last_modified"], cached["body"])
+
+def _add_validators(headers: dict, cached: Optional[dict]):
+    """Make the request conditional on the cached copy still being current."""
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+def github_request(endpoint: str) -> Optional[dict]:
+    """Make a GitHub API request."""
+    url = f"https://api.github.com{endpoint}" if endpoint.startswith("/") else endpoint
+    headers = {**_base_headers(), "Accept": "application/vnd.github.v3+json"}
+    cached = _cache_get(url)
+    if _cache_fresh(cached):
+        return _loads(cached["body"])
+    _add_validators(headers, cached)
+
+    try:
+        status, resp_headers, data = _request(url, headers, timeout=15)
     except Exception:
         return None
 
-def fetch_raw_content(owner: str, repo: str, path: str) -> Optional[str]:
-    """Fetch raw file content from a repo."""
+    if status == 304 and cached:
+        _cache_revalidated(url, cached)
+        return _loads(cached["body"])
+    if status == 404:
+        return None
+    if status >= 300:
+        raise urllib.error.HTTPError(url, status, http.client.responses.get(status, ""),
+                                     resp_headers, None)
+    _cache_put(url, resp_headers.get("ETag"), resp_headers.get("Last-Modified"), data.decode())
+    return _loads(data)
+
+def fetch_raw_content(owner: str, repo: str, path: str,
+                      max_bytes: Optional[int] = None) -> Optional[str]:
+    """Fetch raw file content from a repo.
+
+    With max_bytes, only that many leading bytes are requested (Range header)
+    and read; a cut-off trailing line is dropped.
+    """
     url = f"https://raw.githubusercontent.com/{owner}/{repo}/HEAD/{path}"
-    headers = {"User-Agent": "repo-summarize"}
-    token = get_github_token()
-    if token:
-        headers["Authorization"] = f"token {token}"
+    headers = dict(_base_headers())
+    cache_key = url
+    if max_bytes:
+        headers["Range"] = f"bytes=0-{max_bytes - 1}"
+        headers["Accept-Encoding"] = "identity"   # a byte range of gzip data is useless
+        cache_key = f"{url}#{headers['Range']}"   # never mix partial and full bodies
+    cached = _cache_get(cache_key)
+    if _cache_fresh(cached):
+        return cached["body"]
+    _add_validators(headers, cached)
+
+    try:
+        status, resp_headers, data = _request(url, headers, timeout=10, max_bytes=max_bytes)
+    except Exception:
+        return None
+
+    if status == 304 and cached:
+        _cache_revalidated(cache_key, cached)
+        return cached["body"]
+    if status >= 300:
+        return None
+    if max_bytes and len(data) >= max_bytes:
+        data = data[:data.rfind(b"\n") + 1] or data
+    try:
+        body = data.decode("ascii")   # common case, no error handling needed
+    except UnicodeDecodeError:
+        body = data.decode("utf-8", errors="replace")
+    _cache_put(cache_key, resp_headers.get("ETag"), resp_headers.get("Last-Modified"), body)
+    return body
+
+def fetch_readme_head(owner: str, repo: str, max_bytes: int = 16384) -> Optional[str]:
+    """Fetch the start of the README -- all extract_purpose() ever reads."""
+    return fetch_raw_content(owner, repo, "README.md", max_bytes)
+
+# One GraphQL query covers what /repos, /languages and /contents return.
+_REPO_QUERY = """
+query($o: String!, $n: String!) {
+  repository(owner: $o, name: $n) {
+    stargazerCount forkCount description url
+    primaryLanguage { name }
+    languages(first: 100, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }
+    object(expression: "HEAD:") { ... on Tree { entries { name type } } }
+  }
+}
+"""
+
+_ENTRY_TYPES = {"tree": "dir", "blob": "file", "commit": "submodule"}
+
+def github_graphql(query: str, variables: dict) -> Optional[dict]:
+    """Run a GitHub GraphQL query.  Needs a token; returns None on any failure.
+
+    GraphQL is a POST with no ETag, so results are only cached under
+    --cache-ttl, keyed on the query and its variables.
+    """
+    if not get_github_token():
+        return None
+    url = "https://api.github.com/graphql"
+    headers = {**_base_headers(), "Content-Type": "application/json"}
+    payload = json.dumps({"query": query, "variables": variables}).encode()
+    cache_key = f"{url}#{payload.decode()}"
+    cached = _cache_get(cache_key)
+    if _cache_fresh(cached):
+        return _loads(cached["body"]).get("data")
 
     try:
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            return resp.read().decode("utf-8", errors="replace")
+        status, _, data = _request(url, headers, timeout=15, data=payload)
+        if status != 200:
+            return None
+        result = _loads(data)
     except Exception:
         return None
+    if result.get("data") and not result.get("errors"):
+        _cache_put(cache_key, None, None, data.decode())
+    return result.get("data")
+
+def fetch_repo_graphql(owner: str, repo: str) -> Optional[tuple]:
+    """Fetch (repo_data, languages, contents) in one GraphQL round-trip,
+    reshaped to match the REST responses."""
+    node = (github_graphql(_REPO_QUERY, {"o": owner, "n": repo}) or {}).get("repository")
+    if not node:
+        return None
+
+    repo_data = {
+        "stargazers_count": node["stargazerCount"],
+        "forks_count": node["forkCount"],
+        "language": (node.get("primaryLanguage") or {}).get("name"),
+        "description": node.get("description"),
+        "html_url": node["url"],
+    }
+    languages = {e["node"]["name"]: e["size"] for e in node["languages"]["edges"]}
+    contents = [
+        {"name": e["name"], "type": _ENTRY_TYPES.get(e["type"], e["type"])}
+        for e in (node.get("object") or {}).get("entries", [])
+    ]
+    return repo_data, languages, contents
+
+async def fetch_repo(owner: str, repo: str, languages: bool = True) -> tuple:
+    """Fetch repo info, languages, top-level contents and README concurrently.
+
+    With a token the first three come from a single GraphQL query; otherwise
+    (or if that fails) from REST calls, skipping /languages (returned as None)
+    when *languages* is false.  Each blocking request runs on its own worker
+    thread, so total latency is roughly that of the slowest call rather than
+    the sum.
+    """
+    readme = asyncio.create_task(asyncio.to_thread(fetch_readme_head, owner, repo))
+
+    meta = None
+    if get_github_token():
+        meta = await asyncio.to_thread(fetch_repo_graphql, owner, repo)
+    if meta is None:
+        base = f"/repos/{owner}/{repo}"
+        calls = [
+            asyncio.to_thread(github_request, base),
+            asyncio.to_thread(github_request, f"{base}/contents"),
+        ]
+        if languages:
+            calls.append(asyncio.to_thread(github_request, f"{base}/languages"))
+        repo_data, contents, *langs = await asyncio.gather(*calls)
+        meta = (repo_data, langs[0] if langs else None, contents)
+    return (*meta, await readme)
 
 def parse_repo_arg(repo_arg: str) -> tuple[str, str]:
     """Parse repo argument into (owner, repo) tuple."""
-    # Handle full URL
-    match = re.match(r"https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$", repo_arg)
-    if match:
-        return match.groups()
-
-    # Handle owner/repo format
-    if "/" in repo_arg and not repo_arg.startswith("http"):
+    if repo_arg.startswith("http"):
+        # Handle full URL
+        url = urlsplit(repo_arg)
+        parts = url.path.strip("/").split("/") if url.netloc in ("github.com", "www.github.com") else []
+    else:
+        # Handle owner/repo format
         parts = repo_arg.strip("/").split("/")
-        if len(parts) >= 2:
-            return parts[0], parts[1]
+
+    if len(parts) >= 2 and parts[0] and parts[1]:
+        return parts[0], parts[1].removesuffix(".git")
 
     raise ValueError(f"Invalid repo format: {repo_arg}\nUse 'owner/repo' or 'https://github.com/owner/repo'")
 
@@ -111,36 +382,29 @@ def extract_purpose(readme: str) -> str:
     if not readme:
         return "No README found."
 
-    lines = readme.strip().split("\n")
     purpose_lines = []
+    joined_len = -1   # len(" ".join(purpose_lines)), kept up to date
 
     # Skip title and badges, find first real paragraph
     in_content = False
-    for line in lines:
-        stripped = line.strip()
-
-        # Skip empty lines at start
-        if not stripped and not in_content:
-            continue
-
-        # Skip markdown headers
-        if stripped.startswith("#"):
+    for line in io.StringIO(readme):
+        # Skip headers, badges, images and HTML tags
+        if _SKIP_LINE_RE.match(line):
             in_content = True
             continue
 
-        # Skip badges and images
-        if stripped.startswith("[![") or stripped.startswith("!["):
-            continue
+        stripped = line.strip()
 
-        # Skip HTML tags
-        if stripped.startswith("<"):
+        # Skip empty lines at start
+        if not stripped and not in_content:
             continue
 
         # Found content
         if stripped:
             in_content = True
             purpose_lines.append(stripped)
-            if len(" ".join(purpose_lines)) > 200:
+            joined_len += len(stripped) + 1
+            if joined_len > 200:
                 break
 
     purpose = " ".join(purpose_lines)[:300]
@@ -149,108 +413,177 @@ def extract_purpose(readme: str) -> str:
 
     return purpose or "No description found in README."
 
-def summarize_structure(contents: list[dict]) -> list[str]:
-    """Summarize the top-level directory structure."""
+def summarize_structure(contents: list[dict]) -> tuple[list[str], list[str]]:
+    """Summarize the top-level directory structure into (dirs, key_files)."""
     dirs = []
     key_files = []
+    add_dir = dirs.append
+    add_file = key_files.append
+    important = IMPORTANT_FILES
 
-    important_files = {"README.md", "package.json", "setup.py", "pyproject.toml",
-                       "Cargo.toml", "go.mod", "Makefile", "CONTRIBUTING.md"}
-
-    for item in contents[:50]:  # Limit to first 50 items
+    for item in islice(contents, 50):  # Limit to first 50 items
         name = item.get("name", "")
         item_type = item.get("type", "")
 
         if item_type == "dir" and not name.startswith("."):
-            dirs.append(name)
-        elif item_type == "file" and name in important_files:
-            key_files.append(name)
+            add_dir(name)
+        elif item_type == "file" and name in important:
+            add_file(name)
 
     return dirs[:10], key_files
 
+async def summarize_one(owner: str, repo: str, languages: bool = True) -> Optional[dict]:
+    """Fetch and summarize one repository.  Returns None if it doesn't exist.
+
+    languages=False may skip the language breakdown request; "languages" is
+    then None and only "primary_language" is known.
+    """
+    repo_data, lang_bytes, contents, readme = await fetch_repo(owner, repo, languages)
+    if not repo_data:
+        return None
+
+    contents = contents or []
+
+    # Process data
+    if lang_bytes is None and not languages:
+        top_languages = None
+    else:
+        lang_bytes = lang_bytes or {}
+        total_bytes = sum(lang_bytes.values()) or 1
+        top_languages = {k: round(v / total_bytes * 100)
+                         for k, v in heapq.nlargest(5, lang_bytes.items(), key=lambda x: x[1])}
+
+    dirs, key_files = summarize_structure(contents if isinstance(contents, list) else [])
+    purpose = extract_purpose(readme)
+
+    return {
+        "repository": f"{owner}/{repo}",
+        "stars": repo_data.get("stargazers_count", 0),
+        "forks": repo_data.get("forks_count", 0),
+        "primary_language": repo_data.get("language"),
+        "description": repo_data.get("description"),
+        "purpose": purpose,
+        "languages": top_languages,
+        "directories": dirs,
+        "key_files": key_files,
+        "url": repo_data.get("html_url")
+    }
+
+async def summarize_many(repo_args: list[str], concurrency: int = 10):
+    """Summarize many repositories, printing one JSON object per line as each
+    finishes.  Failures are reported inline as {"repository", "error"}."""
+    sem = asyncio.Semaphore(concurrency)
+    # every repo in flight may have up to four blocking requests on threads
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=concurrency * 4))
+
+    async def one(repo_arg: str) -> dict:
+        async with sem:
+            try:
+                owner, repo = parse_repo_arg(repo_arg)
+                summary = await summarize_one(owner, repo)
+            except Exception as e:
+                return {"repository": repo_arg, "error": str(e)}
+            return summary or {"repository": f"{owner}/{repo}", "error": "not found"}
+
+    for task in asyncio.as_completed([one(arg) for arg in repo_args]):
+        print(json.dumps(await task), flush=True)
+
+def print_summary(summary: dict):
+    """Print a summary in human-readable form."""
+    stars = format_number(summary["stars"])
+    forks = format_number(summary["forks"])
+    primary_lang = summary["primary_language"] or "Unknown"
+    languages = summary["languages"]
+    dirs = summary["directories"]
+    key_files = summary["key_files"]
+
+    print(f"Repository: {summary['repository']}")
+    print(f"Stars: {stars} | Forks: {forks} | Language: {primary_lang}")
+    print()
+
+    print("PURPOSE:")
+    print(summary["purpose"])
+    print()
+
+    if languages:
+        top_languages = list(languages.items())
+        print("TECH STACK:")
+        primary = top_languages[0]
+        print(f"- Primary: {primary[0]} ({primary[1]}%)")
+        if len(top_languages) > 1:
+            others = ", ".join(lang for lang, _ in top_languages[1:4])
+            print(f"- Also: {others}")
+        print()
+    elif languages is None and summary["primary_language"]:
+        # breakdown not fetched: no percentages or secondary languages known
+        print("TECH STACK:")
+        print(f"- Primary: {summary['primary_language']}")
+        print()
+
+    if dirs:
+        print("STRUCTURE:")
+        for d in dirs[:6]:
+            print(f"- {d}/")
+        if len(dirs) > 6:
+            print(f"  ... and {len(dirs) - 6} more directories")
+        print()
+
+    if key_files:
+        print("KEY FILES:")
+        for f in key_files:
+            print(f"- {f}")
+        print()
+
+    print(f"URL: {summary['url']}")
+
 def main():
     parser = argparse.ArgumentParser(description="Summarize a GitHub repository")
-    parser.add_argument("repo", help="Repository (owner/repo or full URL)")
+    parser.add_argument("repo", nargs="?", help="Repository (owner/repo or full URL)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--repos-file", metavar="FILE",
+                        help="Summarize every repo listed in FILE (one per line) as JSON lines")
+    parser.add_argument("--cache-ttl", type=float, default=0, metavar="SECONDS",
+                        help="Reuse cached responses younger than this without asking GitHub")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Don't read or write the response cache")
     args = parser.parse_args()
 
+    global CACHE_TTL, USE_CACHE
+    CACHE_TTL = args.cache_ttl
+    USE_CACHE = not args.no_cache
+
+    if args.repos_file:
+        try:
+            text = Path(args.repos_file).read_text()
+        except OSError as e:
+            print(str(e), file=sys.stderr)
+            sys.exit(1)
+        repo_args = [line.strip() for line in text.splitlines()
+                     if line.strip() and not line.lstrip().startswith("#")]
+        asyncio.run(summarize_many(repo_args))
+        return
+
+    if not args.repo:
+        parser.error("a repository or --repos-file is required")
+
     try:
         owner, repo = parse_repo_arg(args.repo)
     except ValueError as e:
         print(str(e), file=sys.stderr)
         sys.exit(1)
 
-    # Fetch repo info
-    repo_data = github_request(f"/repos/{owner}/{repo}")
-    if not repo_data:
+    # Fetch repo info, languages, contents and README in parallel
+    # (the per-language byte breakdown is only shown in JSON output)
+    summary = asyncio.run(summarize_one(owner, repo, languages=args.json))
+    if not summary:
         print(f"Repository not found: {owner}/{repo}", file=sys.stderr)
         sys.exit(1)
 
-    # Fetch additional data
-    languages = github_request(f"/repos/{owner}/{repo}/languages") or {}
-    contents = github_request(f"/repos/{owner}/{repo}/contents") or []
-    readme = fetch_raw_content(owner, repo, "README.md")
-
-    # Process data
-    total_bytes = sum(languages.values()) if languages else 1
-    lang_percentages = {k: round(v / total_bytes * 100) for k, v in languages.items()}
-    top_languages = sorted(lang_percentages.items(), key=lambda x: -x[1])[:5]
-
-    dirs, key_files = summarize_structure(contents if isinstance(contents, list) else [])
-    purpose = extract_purpose(readme)
-
     if args.json:
-        output = {
-            "repository": f"{owner}/{repo}",
-            "stars": repo_data.get("stargazers_count", 0),
-            "forks": repo_data.get("forks_count", 0),
-            "primary_language": repo_data.get("language"),
-            "description": repo_data.get("description"),
-            "purpose": purpose,
-            "languages": dict(top_languages),
-            "directories": dirs,
-            "key_files": key_files,
-            "url": repo_data.get("html_url")
-        }
-        print(json.dumps(output, indent=2))
+        print(json.dumps(summary, indent=2))
     else:
-        # Human-readable output
-        stars = format_number(repo_data.get("stargazers_count", 0))
-        forks = format_number(repo_data.get("forks_count", 0))
-        primary_lang = repo_data.get("language") or "Unknown"
-
-        print(f"Repository: {owner}/{repo}")
-        print(f"Stars: {stars} | Forks: {forks} | Language: {primary_lang}")
-        print()
-
-        print("PURPOSE:")
-        print(purpose)
-        print()
-
-        if top_languages:
-            print("TECH STACK:")
-            primary = top_languages[0]
-            print(f"- Primary: {primary[0]} ({primary[1]}%)")
-            if len(top_languages) > 1:
-                others = ", ".join(lang for lang, _ in top_languages[1:4])
-                print(f"- Also: {others}")
-            print()
-
-        if dirs:
-            print("STRUCTURE:")
-            for d in dirs[:6]:
-                print(f"- {d}/")
-            if len(dirs) > 6:
-                print(f"  ... and {len(dirs) - 6} more directories")
-            print()
-
-        if key_files:
-            print("KEY FILES:")
-            for f in key_files:
-                print(f"- {f}")
-            print()
-
-        print(f"URL: {repo_data.get('html_url')}")
+        print_summary(summary)
 
 if __name__ == "__main__":
     main()